@@ -0,0 +1,246 @@
+"""
+Batch processing file.
+
+This file contains methods used for headless processing of many time series files at once.
+Each file is analysed and forecasted in separate worker process,
+and results are streamed to single CSV or JSON lines report file.
+"""
+
+
+import csv
+import glob
+import hashlib
+import json
+import multiprocessing
+import os
+import traceback
+from functools import partial
+
+import numpy as np
+from matplotlib import pyplot as plt
+from threadpoolctl import threadpool_limits
+
+import app
+from app.utills.exceptions import exception_message
+from app.utills.file_manager import FileManager
+from app.models import forecasting
+from app.models import stationarity
+from app.models.time_series import TimeSeries
+
+
+# report columns of each forecasting model
+MODEL_COLUMNS = {
+    "ar": ["rmse", "aic", "bic", "hqic", "lag", "plot"],
+    "arima": ["rmse", "aic", "bic", "hqic", "d", "plot"],
+    "ets": ["rmse", "aic", "bic", "hqic", "alpha", "beta", "gamma", "plot"],
+}
+
+# columns of report file
+REPORT_FIELDS = [
+    "file",
+    "name",
+    "status",
+    "error",
+    "minimum_value",
+    "maximum_value",
+    "average_value",
+    "median_value",
+    "standard_deviation_value",
+    "interquartile_value",
+] + [f"{model}_{column}" for model, columns in MODEL_COLUMNS.items() for column in columns]
+
+
+def run(source: str, report_path: str, settings: dict, workers: int = None, resume: bool = False) -> int:
+    """Analyses and forecasts all time series files matching 'source' directory or glob pattern,
+    using pool of 'workers' processes, and streams results to 'report_path' file.
+    Report format is JSON lines for '.jsonl' extension and CSV otherwise.
+
+    If 'resume' is set, files successfully processed in existing report are skipped,
+    failed files are processed again, and new results are appended to this report.
+    Returns number of processed files.
+    """
+
+    # non-interactive matplotlib backend, inherited by worker processes
+    plt.switch_backend("Agg")
+
+    # list of files to process
+    files = find_files(source=source, exclude=report_path)
+
+    with BatchReport(path=report_path, resume=resume) as report:
+
+        # skipping files processed by previous, interrupted run
+        files = [file_path for file_path in files if file_path not in report.processed]
+        app.logging.info(f"batch processing of {len(files)} files, {len(report.processed)} skipped.")
+
+        if settings.get("plots_dir"):
+            os.makedirs(settings["plots_dir"], exist_ok=True)
+
+        # processing files in pool and writing results as soon as they are ready
+        with multiprocessing.Pool(processes=workers or os.cpu_count(), initializer=_init_worker) as pool:
+            results = pool.imap_unordered(partial(process_file, settings=settings), files, chunksize=1)
+            for number, record in enumerate(results, start=1):
+                report.write(record=record)
+                app.logging.info(f"[{number}/{len(files)}] time series '{record['name']}' -> {record['status']}")
+
+    return len(files)
+
+
+def find_files(source: str, exclude: str = None) -> list:
+    """Returns sorted list of absolute paths of supported time series files from 'source' directory,
+    or of files matching 'source' glob pattern.
+    Directories, unsupported files and file given by 'exclude' argument, like batch report, are skipped."""
+    pattern = os.path.join(source, "*") if os.path.isdir(source) else source
+    excluded = os.path.abspath(exclude) if exclude else None
+    paths = (os.path.abspath(path) for path in glob.glob(pattern, recursive=True))
+    return sorted(
+        path for path in paths
+        if os.path.isfile(path) and path.endswith(FileManager.EXTENSIONS) and path != excluded
+    )
+
+
+def process_file(file_path: str, settings: dict) -> dict:
+    """Analyses and forecasts, by models listed in 'settings', time series included in 'file_path' file.
+    Returns report record of this time series.
+
+    Models are taken from registered forecasting models, with keyword arguments from 'settings' parameters.
+    Failure of one model does not stop other models,
+    all errors are collected in 'error' column of record.
+    """
+    name = FileManager.get_file_name_from_(path=file_path)
+    record = {"file": file_path, "name": name}
+
+    # short hash of file path, that distinguishes plots of files with the same name
+    path_hash = hashlib.sha1(file_path.encode()).hexdigest()[:8]
+    errors = []
+
+    try:
+
+        # loads content of file and creation of TimeSeries object
+        data_file = FileManager.read_file(file_name=file_path)
+        time_series = TimeSeries(dataset=data_file, name=name)
+        record.update(time_series.info)
+
+        # split time series to train and test datasets
+        train_data, test_data = time_series.split(ratio=settings["split_ratio"])
+
+        # training and forecasting of each selected model
+        for model in settings["models"]:
+            try:
+                parameters = _model_parameters(model=model, settings=settings, train_data=train_data)
+                results = forecasting.MODELS[model](train_data=train_data, test_data=test_data, **parameters)
+                if model == "arima":
+                    results["d"] = parameters["order"][1]
+                if settings.get("plots_dir"):
+                    results["plot"] = forecasting.draw_forecast(
+                        test_data=test_data,
+                        forecast_results=results["forecast"],
+                        file_name=f"{name}_{path_hash}_forecast_{model}_{settings['split_ratio']}.png",
+                        directory=settings["plots_dir"]
+                    )
+                record.update({f"{model}_{column}": results[column] for column in MODEL_COLUMNS[model] if column in results})
+            except Exception:
+                app.logging.error(f"batch.process_file() '{file_path}' {model} -> {traceback.format_exc()}")
+                errors.append(f"{model}: {exception_message()}")
+
+    except Exception:
+        app.logging.error(f"batch.process_file() '{file_path}' -> {traceback.format_exc()}")
+        errors.append(exception_message())
+
+    record["status"] = "error" if errors else "ok"
+    record["error"] = "; ".join(errors)
+    return {key: _serializable(value) for key, value in record.items()}
+
+
+def _model_parameters(model: str, settings: dict, train_data: np.array) -> dict:
+    """Returns keyword arguments of forecasting method of 'model' from 'settings' parameters.
+    If ARIMA differencing order is not given, it is suggested by stationarity tests of 'train_data'."""
+    parameters = dict(settings["parameters"][model])
+    if model == "arima" and parameters["order"][1] is None:
+        p, _, q = parameters["order"]
+        parameters["order"] = (p, stationarity.suggest_differencing(values=train_data), q)
+    return parameters
+
+
+class BatchReport:
+    """Report file, to which batch processing records are streamed.
+
+    Records are written as CSV rows, or as JSON lines for '.jsonl' extension, one record per line,
+    and flushed immediately, so report of interrupted run contains all finished records.
+    """
+
+    def __init__(self, path: str, resume: bool):
+        """Opens report file given by 'path' argument.
+        If 'resume' is set, successful records of existing report are kept and their files are marked as processed,
+        failed records are removed, so that their files are processed again.
+        """
+        if path.endswith(".json"):
+            raise ValueError("Report is written as JSON lines, use '.jsonl' extension!")
+
+        self.path = path
+        self.format = "jsonl" if path.endswith(".jsonl") else "csv"
+
+        # successful records of previous run
+        records = []
+        if resume and os.path.exists(path):
+            self._drop_partial_record()
+            records = [record for record in self._read_records() if record["status"] == "ok"]
+        self.processed = {record["file"] for record in records}
+
+        # rewriting kept records to temporary file, which replaces report
+        temporary_path = f"{path}.tmp"
+        self._open(path=temporary_path, mode="w")
+        for record in records:
+            self.write(record=record)
+        self._file.close()
+        os.replace(temporary_path, path)
+
+        self._open(path=path, mode="a")
+
+    def __enter__(self) -> object:
+        return self
+
+    def __exit__(self, *args):
+        self._file.close()
+
+    def write(self, record: dict):
+        """Writes single record to report and flushes it to disk."""
+        if self.format == "csv":
+            self._writer.writerow(record)
+        else:
+            self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def _open(self, path: str, mode: str):
+        """Opens report file of given 'path' in given 'mode', and writes CSV header to empty file."""
+        self._file = open(path, mode, newline="")
+        if self.format == "csv":
+            self._writer = csv.DictWriter(self._file, fieldnames=REPORT_FIELDS, extrasaction="ignore")
+            if self._file.tell() == 0:
+                self._writer.writeheader()
+
+    def _read_records(self) -> list:
+        """Returns list of records already stored in report."""
+        with open(self.path, newline="") as report_file:
+            if self.format == "csv":
+                return list(csv.DictReader(report_file))
+            return [json.loads(line) for line in report_file if line.strip()]
+
+    def _drop_partial_record(self):
+        """Removes last, not terminated line of report, left by interrupted run."""
+        with open(self.path, "rb+") as report_file:
+            content = report_file.read()
+            report_file.truncate(content.rfind(b"\n") + 1)
+
+
+def _init_worker():
+    """Initializes worker process.
+    Sets non-interactive matplotlib backend and limits native thread pools to single thread,
+    so that parallel workers do not oversubscribe CPU cores.
+    """
+    plt.switch_backend("Agg")
+    threadpool_limits(limits=1)
+
+
+def _serializable(value):
+    """Converts numpy scalar values to built-in python types."""
+    return value.item() if isinstance(value, np.generic) else value
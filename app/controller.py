@@ -9,15 +9,14 @@ import os
 import traceback
 
 from flask import render_template
-from math import sqrt
 from matplotlib import pyplot as plt
-from sklearn.metrics import mean_squared_error
-from statsmodels.tsa.ar_model import AR
-from statsmodels.tsa.arima_model import ARIMA
 
 import app
 import config
 from app.utills.file_manager import FileManager
+from app.models import comparison
+from app.models import forecasting
+from app.models import stationarity
 from app.models.time_series import TimeSeries
 
 
@@ -43,6 +42,9 @@ def analysis(file_path: str):
         time_series = TimeSeries(dataset=data_file, name=name)
         data["analyse"] = time_series.info
 
+        # stationarity tests of differenced time series
+        data["stationarity"] = stationarity.test_differencing(values=time_series.data["value"].values)
+
         # visualisation of created time series
         plots = _visualisation(file_path=file_path)
         if plots:
@@ -91,38 +93,18 @@ def forecast_ar(file_path: str, parameters: dict):
         # split time series to train and test datasets
         train_data, test_data = time_series.split(ratio=data["split_ratio"])
 
-        # creation of auto regression model
-        model = AR(train_data)
-
-        # auto regression model training
-        trained_model = model.fit(ic=data["ic"])
-
-        # forecast range
-        start = len(train_data)
-        end = start + len(test_data) - 1
-
-        # forecasting
-        forecast_results = trained_model.predict(start=start, end=end)
-
-        # RMSE - root-mean-square error
-        rmse = sqrt(mean_squared_error(test_data, forecast_results))
+        # auto regression model training and forecasting
+        results = forecasting.ar_forecast(train_data=train_data, test_data=test_data, ic=data["ic"])
 
         # plotting forecasting results and saving to file
-        plt.plot(test_data, color="blue", label="rzeczywiste")   # plotting real values
-        plt.plot(forecast_results, color="red", label="prognozowane") # plotting predicted values
-        plt.legend(loc="upper right")
         plot_name = f"{time_series.name}_forecast_ar_{data['ic']}_{data['split_ratio']}.png"  # name of plotted file
-        plot_path = os.path.join(config.STATIC_DIR, plot_name)  # plotted file path
-        plt.savefig(plot_path)  # saving plot to file
-
-        # clearing matplotlib plot
-        plt.clf()
+        forecasting.draw_forecast(test_data=test_data, forecast_results=results["forecast"], file_name=plot_name)
 
         # preparing data for template rendering
         data["forecast_plot"] = plot_name
-        data["lag"] = trained_model.k_ar
-        data["tobs"] = trained_model.n_totobs
-        data["rmse"] = rmse
+        data["lag"] = results["lag"]
+        data["tobs"] = results["tobs"]
+        data["rmse"] = results["rmse"]
         data["ic"] = config.IC_METHODS[data["ic"]]
 
     except Exception:
@@ -156,7 +138,6 @@ def forecast_arima(file_path: str, parameters: dict):
         # preparing parameters
         data["split_ratio"] = float(parameters.get("split_ratio", 0.8))
         data["ar"] = int(parameters.get("arima_ar", 10))
-        data["i"] = int(parameters.get("arima_i", 1))
         data["ma"] = int(parameters.get("arima_ma", 2))
 
         # loads content of file
@@ -169,42 +150,33 @@ def forecast_arima(file_path: str, parameters: dict):
         # split time series to train and test datasets
         train_data, test_data = time_series.split(ratio=data["split_ratio"])
 
-        # creation of ARIMA model
-        model = ARIMA(
-            train_data,
-            order = (
+        # differencing order, suggested by stationarity tests of train dataset if it is not given
+        if "arima_i" in parameters:
+            data["i"] = int(parameters["arima_i"])
+        else:
+            data["i"] = stationarity.suggest_differencing(values=train_data)
+
+        # ARIMA model training and forecasting
+        results = forecasting.arima_forecast(
+            train_data=train_data,
+            test_data=test_data,
+            order=(
                 data["ar"],
                 data["i"],
                 data["ma"]
             )
         )
 
-        # ARIMA model training
-        trained_model = model.fit()
-
-        # forecast range
-        steps = len(test_data)
-
-        # forecasting
-        forecast_results = trained_model.forecast(steps=steps)[0]
-
         # plotting forecasting results and saving to file
-        plt.plot(test_data, color="blue", label="rzeczywiste")   # plotting real values
-        plt.plot(forecast_results, color="red", label="prognozowane") # plotting predicted values
-        plt.legend(loc="upper right")
         plot_name = f"{time_series.name}_forecast_arima_{data['ar']}_{data['i']}_{data['ma']}.png"  # name of plotted file
-        plot_path = os.path.join(config.STATIC_DIR, plot_name)  # plotted file path
-        plt.savefig(plot_path)  # saving plot to file
-
-        # clearing matplotlib plot
-        plt.clf()
+        forecasting.draw_forecast(test_data=test_data, forecast_results=results["forecast"], file_name=plot_name)
 
         # preparing data for template rendering
         data["forecast_plot"] = plot_name
-        data["tobs"] = trained_model.n_totobs
-        data["aic"] = trained_model.aic
-        data["bic"] = trained_model.bic
-        data["hqic"] = trained_model.hqic
+        data["tobs"] = results["tobs"]
+        data["aic"] = results["aic"]
+        data["bic"] = results["bic"]
+        data["hqic"] = results["hqic"]
 
     except Exception:
         app.logging.error(f"forecast_arima() -> {traceback.format_exc()}")
@@ -213,6 +185,156 @@ def forecast_arima(file_path: str, parameters: dict):
         return render_template("arima.html", data=data)
 
 
+def forecast_ets(file_path: str, parameters: dict):
+    """Trains and tests Holt-Winters exponential smoothing model by using time series included in file,
+    which path is given by 'file_path' argument, and renders forecast results.
+
+    In first step, contents of file from given path is loaded.
+    Base of loaded file content, TimeSeries class object is created.
+    Before model training, time series is splitted to train and test subsetest
+    basing on given by 'parameters' argument value.
+    Training subset is used for model training, test subset, for testing model accuracy.
+    Model trend and seasonal components are selected base on received from HTML form parameters,
+    smoothing parameters are optimized during training.
+    After model training and test forecasting, results are plotted and saved to file.
+    At the end, this method renders template with forecast results plot, and its parameters.
+    """
+    try:
+
+        app.logging.info("time series forecasting using exponential smoothing")
+        app.logging.info(f"parameters = {parameters}")
+
+        # dictionary that will contain all data for rendering
+        data = {}
+
+        # preparing parameters
+        data["split_ratio"] = float(parameters.get("split_ratio", 0.8))
+        data["trend"] = parameters.get("ets_trend", "") == "on"
+        data["seasonal_period"] = int(parameters.get("ets_seasonal_period", 0))
+
+        # loads content of file
+        data_file = FileManager.read_file(file_name=file_path)
+
+        # creation of TimeSeries object
+        name = FileManager.get_file_name_from_(path=file_path)
+        time_series = TimeSeries(dataset=data_file, name=name)
+
+        # split time series to train and test datasets
+        train_data, test_data = time_series.split(ratio=data["split_ratio"])
+
+        # exponential smoothing model training and forecasting
+        results = forecasting.ets_forecast(
+            train_data=train_data,
+            test_data=test_data,
+            trend=data["trend"],
+            seasonal_period=data["seasonal_period"]
+        )
+
+        # plotting forecasting results and saving to file
+        plot_name = f"{time_series.name}_forecast_ets_{int(data['trend'])}_{data['seasonal_period']}_{data['split_ratio']}.png"  # name of plotted file
+        forecasting.draw_forecast(test_data=test_data, forecast_results=results["forecast"], file_name=plot_name)
+
+        # preparing data for template rendering
+        data["forecast_plot"] = plot_name
+        data["tobs"] = results["tobs"]
+        data["alpha"] = results["alpha"]
+        data["beta"] = results["beta"]
+        data["gamma"] = results["gamma"]
+        data["rmse"] = results["rmse"]
+        data["aic"] = results["aic"]
+        data["bic"] = results["bic"]
+        data["hqic"] = results["hqic"]
+
+    except Exception:
+        app.logging.error(f"forecast_ets() -> {traceback.format_exc()}")
+    else:
+        app.logging.info(f"time series '{name}' forecasted successfully using exponential smoothing!")
+        return render_template("ets.html", data=data)
+
+
+def compare_models(file_path: str, parameters: dict):
+    """Trains and tests concurrently all selected forecasting models by using time series included in file,
+    which path is given by 'file_path' argument, and renders leaderboard of models.
+
+    In first step, contents of file from given path is loaded.
+    Base of loaded file content, TimeSeries class object is created,
+    and splitted only once to train and test subsets, which are shared by all models.
+    Each model is trained in separate process with its own time budget,
+    models exceeding budget are terminated.
+    After comparison, forecasts of all models are plotted on single graph and saved to file.
+    At the end, this method renders template with models ranked by RMSE and comparison plot.
+    """
+    try:
+
+        app.logging.info("time series forecasting models comparison")
+        app.logging.info(f"parameters = {parameters}")
+
+        # dictionary that will contain all data for rendering
+        data = {}
+
+        # preparing parameters
+        data["split_ratio"] = float(parameters.get("split_ratio", 0.8))
+
+        # loads content of file
+        data_file = FileManager.read_file(file_name=file_path)
+
+        # creation of TimeSeries object
+        name = FileManager.get_file_name_from_(path=file_path)
+        time_series = TimeSeries(dataset=data_file, name=name)
+
+        # split time series to train and test datasets
+        train_data, test_data = time_series.split(ratio=data["split_ratio"])
+
+        # selected models, with ARIMA differencing order suggested by stationarity tests of train dataset if it is not given
+        selected = [model for model in forecasting.MODELS if parameters.get(f"compare_{model}")] or list(forecasting.MODELS)
+        if "arima" in selected and "arima_i" not in parameters:
+            parameters["arima_i"] = stationarity.suggest_differencing(values=train_data)
+        models = {model: (forecasting.MODELS[model], _model_parameters(name=model, parameters=parameters)) for model in selected}
+        budgets = {model: float(parameters.get(f"{model}_budget", config.MODEL_TIME_BUDGETS[model])) for model in selected}
+
+        # concurrent training and forecasting of all models
+        leaderboard = comparison.compare(train_data=train_data, test_data=test_data, models=models, budgets=budgets)
+
+        # plotting forecasting results of all models and saving to file
+        forecasts = {config.MODEL_NAMES[result["model"]]: result["forecast"] for result in leaderboard if result["status"] == "ok"}
+        plot_name = f"{time_series.name}_forecast_comparison_{'_'.join(selected)}_{data['split_ratio']}.png"  # name of plotted file
+        forecasting.draw_comparison(test_data=test_data, forecasts=forecasts, file_name=plot_name)
+
+        # preparing data for template rendering
+        for result in leaderboard:
+            result["budget"] = budgets[result["model"]]
+            result["model"] = config.MODEL_NAMES[result["model"]]
+        data["forecast_plot"] = plot_name
+        data["leaderboard"] = leaderboard
+
+    except Exception:
+        app.logging.error(f"compare_models() -> {traceback.format_exc()}")
+    else:
+        app.logging.info(f"time series '{name}' forecasting models compared successfully!")
+        return render_template("compare.html", data=data)
+
+
+def _model_parameters(name: str, parameters: dict) -> dict:
+    """Returns keyword arguments of forecasting method of model given by 'name' argument,
+    base on received from HTML form parameters."""
+    if name == "ar":
+        return {"ic": parameters.get("ar_ic", "aic")}
+    if name == "arima":
+        return {
+            "order": (
+                int(parameters.get("arima_ar", 10)),
+                int(parameters.get("arima_i", 1)),
+                int(parameters.get("arima_ma", 2))
+            )
+        }
+    if name == "ets":
+        return {
+            "trend": parameters.get("ets_trend", "") == "on",
+            "seasonal_period": int(parameters.get("ets_seasonal_period", 0))
+        }
+    return {}
+
+
 def _visualisation(file_path: str) -> list:
     """Creates plots of time series, that path is given as 'file_path' argument.
     This method returns list of all created and saved plots names.
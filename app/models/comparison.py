@@ -0,0 +1,97 @@
+"""
+Models comparison file.
+
+This file contains methods that train and test many forecasting models concurrently,
+on the same train and test datasets, and rank them by forecast accuracy.
+"""
+
+
+import multiprocessing
+import time
+from multiprocessing.connection import wait
+
+import numpy as np
+from threadpoolctl import threadpool_limits
+
+from app.utills.exceptions import exception_message
+
+
+def compare(train_data: np.array, test_data: np.array, models: dict, budgets: dict) -> list:
+    """Trains and tests concurrently models given by 'models' argument and returns leaderboard.
+
+    'models' is dictionary of model name and tuple of forecasting method and its keyword arguments,
+    forecasting method has to accept 'train_data' and 'test_data' arguments and return dictionary with RMSE.
+    Each model is trained in separate process, which is terminated if it exceeds
+    its wall-clock budget in seconds, given in 'budgets' dictionary,
+    so whole comparison never takes longer than the largest budget.
+
+    Returned leaderboard is list of models results, sorted by RMSE,
+    models that failed or exceeded budget are placed at the end.
+    """
+    start = time.monotonic()
+
+    # starting process for each model
+    pending = {}
+    for name, (method, kwargs) in models.items():
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(
+            target=_run_model,
+            args=(sender, method, dict(kwargs, train_data=train_data, test_data=test_data)),
+            daemon=True
+        )
+        process.start()
+        sender.close()
+        pending[receiver] = (name, process)
+
+    # collecting results until all models finish or exceed budgets
+    results = []
+    while pending:
+
+        # terminating processes of models, which exceeded their budgets
+        elapsed = time.monotonic() - start
+        for receiver, (name, process) in list(pending.items()):
+            if elapsed >= budgets[name]:
+                process.terminate()
+                process.join()
+                del pending[receiver]
+                results.append({"model": name, "status": "timeout", "error": f"exceeded {budgets[name]} s budget", "time": elapsed})
+        if not pending:
+            break
+
+        # waiting for first result, but not longer than closest budget
+        timeout = min(budgets[name] for name, _ in pending.values()) - elapsed
+        for receiver in wait(list(pending), timeout=max(timeout, 0)):
+            name, process = pending.pop(receiver)
+            try:
+                result = receiver.recv()
+            except EOFError:
+                # process died without sending result, its exit code is known only after joining
+                process.join()
+                result = {"status": "error", "error": f"process exited with code {process.exitcode}"}
+            process.join()
+            result.update(model=name, time=time.monotonic() - start)
+            results.append(result)
+
+    return _rank(results=results)
+
+
+def _run_model(connection, method, kwargs: dict):
+    """Runs forecasting 'method' in child process and sends its result by 'connection'.
+    Native thread pools are limited to single thread, so that concurrent models do not oversubscribe CPU cores.
+    """
+    threadpool_limits(limits=1)
+    try:
+        result = method(**kwargs)
+        result["status"] = "ok"
+    except Exception:
+        result = {"status": "error", "error": exception_message()}
+    connection.send(result)
+    connection.close()
+
+
+def _rank(results: list) -> list:
+    """Sorts models results by RMSE, with failed models at the end, and numbers their places."""
+    results = sorted(results, key=lambda result: (result["status"] != "ok", result.get("rmse", 0), result["model"]))
+    for place, result in enumerate(results, start=1):
+        result["place"] = place
+    return results
@@ -0,0 +1,239 @@
+"""
+Exponential smoothing model file.
+
+This file contains ExponentialSmoothing class, that implements Holt-Winters forecasting methods.
+"""
+
+
+import numpy as np
+from scipy.optimize import minimize
+from scipy.signal import lfilter
+from scipy.signal import lfiltic
+
+
+class ExponentialSmoothing:
+    """Holt-Winters exponential smoothing model with additive error, trend and seasonality.
+
+    Depending on constructor arguments, model is:
+    - simple exponential smoothing - without trend and seasonality,
+    - Holt's linear method - with trend,
+    - Holt-Winters additive method - with seasonality of given period, and optionally with trend.
+    Smoothing parameters are optimized by minimization of one-step forecast errors sum of squares.
+
+    One-step errors are linear in time series values, so instead of looping over observations,
+    smoothing recursions are computed by single linear filter, which transfer function is
+    det(zI - F) / det(zI - F + g * w'), where F, g and w are state space matrices of the model.
+    """
+
+    def __init__(self, data: np.array, trend: bool = False, seasonal_period: int = None) -> object:
+        """Constructor, that creates ExponentialSmoothing model of time series given by 'data' argument.
+
+        Initial level, slope and seasonal components are estimated from first observations,
+        so time series has to contain at least two observations, or two full seasons if it is seasonal.
+        """
+        self.data = np.asarray(data, dtype=float)
+        self.trend = trend
+        self.seasonal_period = seasonal_period or 0
+
+        # checking if time series is long enough for initial state estimation
+        minimum_length = 2 * self.seasonal_period if self.seasonal_period else 2
+        if len(self.data) < minimum_length:
+            raise ValueError(f"Time series has to contain at least {minimum_length} observations!")
+
+        self.initial_state = self._initial_state()
+        self._basis = self._filter_basis()
+
+        # fitting results
+        self.params = {}
+        self.errors = None
+        self.state = None
+
+    # region PROPERTIES
+
+    @property
+    def nobs(self) -> int:
+        """Returns number of trained observations."""
+        return len(self.data)
+
+    @property
+    def fitted_values(self) -> np.array:
+        """Returns one-step forecasts of trained observations."""
+        return self.data - self.errors
+
+    @property
+    def sse(self) -> float:
+        """Returns sum of squared one-step forecast errors."""
+        return float(np.dot(self.errors, self.errors))
+
+    @property
+    def llf(self) -> float:
+        """Returns Gaussian log-likelihood of fitted model, with variance estimated from errors."""
+        return -self.nobs / 2 * (np.log(2 * np.pi * self.sse / self.nobs) + 1)
+
+    @property
+    def aic(self) -> float:
+        """Returns Akaike information criterion value of fitted model."""
+        return -2 * self.llf + 2 * self._parameters_number
+
+    @property
+    def bic(self) -> float:
+        """Returns Bayesian information criterion value of fitted model."""
+        return -2 * self.llf + self._parameters_number * np.log(self.nobs)
+
+    @property
+    def hqic(self) -> float:
+        """Returns Hannan-Quinn information criterion value of fitted model."""
+        return -2 * self.llf + 2 * self._parameters_number * np.log(np.log(self.nobs))
+
+    @property
+    def _parameters_number(self) -> int:
+        """Returns number of estimated smoothing parameters and initial state components."""
+        smoothing = 1 + self.trend + bool(self.seasonal_period)
+        initial = 1 + self.trend + max(self.seasonal_period - 1, 0)
+        return smoothing + initial
+
+    # endregion
+
+    # region PUBLIC METHODS
+
+    def fit(self) -> object:
+        """Optimizes smoothing parameters and computes final state of model.
+        Returns fitted model itself.
+
+        Each smoothing parameter is searched in unit interval, beta is scaled by alpha
+        and gamma by (1 - alpha), so that trend and seasonal components are smoothed no faster than level.
+        """
+        size = 1 + self.trend + bool(self.seasonal_period)
+        result = minimize(
+            self._sum_of_squares,
+            x0=np.array([0.5, 0.1, 0.1][:size]),
+            method="L-BFGS-B",
+            bounds=[(0.0, 1.0)] * size
+        )
+        alpha, beta, gamma = self._smoothing_parameters(result.x)
+
+        # fitting results
+        self.params = {"alpha": alpha, "beta": beta, "gamma": gamma}
+        self.errors = self._errors(alpha=alpha, beta=beta, gamma=gamma)
+        self.state = self._final_state(alpha=alpha, beta=beta, gamma=gamma)
+        return self
+
+    def forecast(self, steps: int) -> np.array:
+        """Returns forecast of given by 'steps' argument number of future values."""
+        level, slope, season = self.state
+        horizon = np.arange(1, steps + 1)
+        phases = (self.nobs + horizon) % len(season)
+        return level + horizon * slope + season[phases]
+
+    # endregion
+
+    # region PRIVATE METHODS
+
+    def _initial_state(self) -> tuple:
+        """Returns initial level, slope and seasonal components estimated from first observations.
+        Initial state precedes first observation, so that its one-step forecast is level plus slope.
+        Seasonal components are indexed by phase of season, so that they sum up to zero.
+        """
+        if self.seasonal_period:
+            period = self.seasonal_period
+            first_season = self.data[:period]
+            slope = (self.data[period:2 * period].mean() - first_season.mean()) / period if self.trend else 0.0
+            level = first_season.mean() - slope * (period + 1) / 2
+            time = np.arange(1, period + 1)
+            season = np.zeros(period)
+            season[time % period] = first_season - (level + slope * time)
+        else:
+            slope = self.data[1] - self.data[0] if self.trend else 0.0
+            level = self.data[0] - slope
+            season = np.zeros(1)
+        return level, slope, season
+
+    def _filter_basis(self) -> np.array:
+        """Returns polynomials, that define linear filter of one-step forecast errors.
+
+        Numerator of filter transfer function is first row of returned array,
+        denominator is linear combination of all rows with coefficients 1, alpha, beta and gamma.
+        Level and seasonal components have common unit root, which is cancelled for seasonal model.
+        """
+        unit_root = np.array([1.0, -1.0])
+        numerator = np.polymul(unit_root, unit_root) if self.trend else unit_root
+        season_root = np.zeros(self.seasonal_period + 1)
+        if self.seasonal_period:
+            season_root[[0, -1]] = [1.0, -1.0]
+            numerator = np.polymul(numerator, season_root)
+
+        # terms of det(zI - F + g * w') for each smoothing parameter
+        basis = [
+            numerator,
+            np.polydiv(numerator, unit_root)[0],
+            np.polymul([1.0, 0.0], np.polydiv(numerator, np.polymul(unit_root, unit_root))[0]) if self.trend else [0.0],
+            np.polydiv(numerator, season_root)[0] if self.seasonal_period else [0.0],
+        ]
+        if self.seasonal_period:
+            basis = [np.polydiv(polynomial, unit_root)[0] for polynomial in basis]
+
+        # aligning polynomials to common length
+        length = len(basis[0])
+        return np.array([np.pad(polynomial, (length - len(polynomial), 0)) for polynomial in basis])
+
+    def _smoothing_parameters(self, x: np.array) -> tuple:
+        """Returns alpha, beta and gamma smoothing parameters from optimized vector 'x'."""
+        values = iter(x)
+        alpha = next(values)
+        beta = alpha * next(values) if self.trend else 0.0
+        gamma = (1 - alpha) * next(values) if self.seasonal_period else 0.0
+        return alpha, beta, gamma
+
+    def _sum_of_squares(self, x: np.array) -> float:
+        """Returns sum of squared one-step forecast errors for optimized vector 'x'.
+        Parameters, for which filter is unstable, are penalized by the largest float value.
+        """
+        with np.errstate(all="ignore"):
+            errors = self._errors(*self._smoothing_parameters(x))
+            sse = np.dot(errors, errors)
+        return sse if np.isfinite(sse) else np.finfo(float).max
+
+    def _errors(self, alpha: float, beta: float, gamma: float) -> np.array:
+        """Returns one-step forecast errors of model with given smoothing parameters.
+
+        Errors of first observations, which depend on initial state, are computed recursively,
+        and used as initial conditions of linear filter, which computes errors of the rest of observations.
+        """
+        numerator = self._basis[0]
+        denominator = np.dot([1.0, alpha, beta, gamma], self._basis)
+        order = min(len(denominator) - 1, self.nobs)
+
+        head = self._recursive_errors(alpha=alpha, beta=beta, gamma=gamma, steps=order)
+        if order == self.nobs:
+            return head
+
+        initial_conditions = lfiltic(numerator, denominator, y=head[::-1], x=self.data[:order][::-1])
+        tail, _ = lfilter(numerator, denominator, self.data[order:], zi=initial_conditions)
+        return np.concatenate((head, tail))
+
+    def _recursive_errors(self, alpha: float, beta: float, gamma: float, steps: int) -> np.array:
+        """Returns one-step forecast errors of first 'steps' observations,
+        computed by smoothing recursions started from initial state."""
+        level, slope, season = self.initial_state
+        season = season.copy()
+        errors = np.empty(steps)
+        for t in range(steps):
+            phase = (t + 1) % len(season)
+            errors[t] = self.data[t] - (level + slope + season[phase])
+            level += slope + alpha * errors[t]
+            slope += beta * errors[t]
+            season[phase] += gamma * errors[t]
+        return errors
+
+    def _final_state(self, alpha: float, beta: float, gamma: float) -> tuple:
+        """Returns level, slope and seasonal components after last trained observation.
+        Each component is sum of its initial value and weighted one-step errors.
+        """
+        level, slope, season = self.initial_state
+        time = np.arange(1, self.nobs + 1)
+        level = level + self.nobs * slope + np.dot(alpha + beta * (self.nobs - time), self.errors)
+        slope = slope + beta * self.errors.sum()
+        season = season + gamma * np.bincount(time % len(season), weights=self.errors, minlength=len(season))
+        return level, slope, season
+
+    # endregion
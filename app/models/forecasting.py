@@ -0,0 +1,160 @@
+"""
+Forecasting models file.
+
+This file contains methods that train forecasting models on time series train subset,
+forecast test subset range and measure forecast accuracy.
+These methods are independent of flask request context,
+so they are shared by web controller and batch processing.
+"""
+
+
+import os
+from math import sqrt
+
+import numpy as np
+from matplotlib import pyplot as plt
+from sklearn.metrics import mean_squared_error
+from statsmodels.tsa.ar_model import AR
+from statsmodels.tsa.arima_model import ARIMA
+
+import config
+from app.models.exponential_smoothing import ExponentialSmoothing
+
+
+def ar_forecast(train_data: np.array, test_data: np.array, ic: str) -> dict:
+    """Trains autoregressive model on 'train_data' and forecasts values of 'test_data' range.
+    Optimal lag length is selected by criterion given as 'ic' argument.
+    Returns dictionary with forecasted values, selected lag, number of trained observations, RMSE
+    and AIC, BIC, HQIC information criteria values.
+    Statsmodels AR criteria are divided by number of observations, so they are recomputed
+    from log-likelihood, on the same scale as criteria of other models.
+    """
+
+    # creation and training of auto regression model
+    model = AR(train_data)
+    trained_model = model.fit(ic=ic)
+
+    # forecast range
+    start = len(train_data)
+    end = start + len(test_data) - 1
+
+    # forecasting
+    forecast_results = trained_model.predict(start=start, end=end)
+
+    return {
+        "forecast": forecast_results,
+        "lag": trained_model.k_ar,
+        "tobs": trained_model.n_totobs,
+        "rmse": sqrt(mean_squared_error(test_data, forecast_results)),
+        **_information_criteria(
+            llf=trained_model.llf,
+            parameters=trained_model.k_ar + trained_model.k_trend + 1,
+            nobs=trained_model.nobs
+        ),
+    }
+
+
+def arima_forecast(train_data: np.array, test_data: np.array, order: tuple) -> dict:
+    """Trains ARIMA model of (p, d, q) 'order' on 'train_data' and forecasts values of 'test_data' range.
+    Returns dictionary with forecasted values, number of trained observations, RMSE
+    and AIC, BIC, HQIC information criteria values.
+    """
+
+    # creation and training of ARIMA model
+    model = ARIMA(train_data, order=order)
+    trained_model = model.fit()
+
+    # forecasting
+    forecast_results = trained_model.forecast(steps=len(test_data))[0]
+
+    return {
+        "forecast": forecast_results,
+        "tobs": trained_model.n_totobs,
+        "rmse": sqrt(mean_squared_error(test_data, forecast_results)),
+        "aic": trained_model.aic,
+        "bic": trained_model.bic,
+        "hqic": trained_model.hqic,
+    }
+
+
+def ets_forecast(train_data: np.array, test_data: np.array, trend: bool, seasonal_period: int) -> dict:
+    """Trains Holt-Winters exponential smoothing model on 'train_data' and forecasts values of 'test_data' range.
+    Model contains trend component if 'trend' is set, and seasonal component if 'seasonal_period' is given.
+    Returns dictionary with forecasted values, smoothing parameters, number of trained observations, RMSE
+    and AIC, BIC, HQIC information criteria values.
+    """
+
+    # creation and training of exponential smoothing model
+    model = ExponentialSmoothing(train_data, trend=trend, seasonal_period=seasonal_period)
+    trained_model = model.fit()
+
+    # forecasting
+    forecast_results = trained_model.forecast(steps=len(test_data))
+
+    return {
+        "forecast": forecast_results,
+        "alpha": trained_model.params["alpha"],
+        "beta": trained_model.params["beta"],
+        "gamma": trained_model.params["gamma"],
+        "tobs": trained_model.nobs,
+        "rmse": sqrt(mean_squared_error(test_data, forecast_results)),
+        "aic": trained_model.aic,
+        "bic": trained_model.bic,
+        "hqic": trained_model.hqic,
+    }
+
+
+def draw_forecast(test_data: np.array, forecast_results: np.array, file_name: str, directory: str = config.STATIC_DIR) -> str:
+    """Plots real and forecasted values and saves created graph to 'file_name' file in 'directory'.
+    Returns saved figure file name.
+    """
+
+    # plotting forecasting results on separate figure
+    figure = plt.figure()
+    plt.plot(test_data, color="blue", label="rzeczywiste")   # plotting real values
+    plt.plot(forecast_results, color="red", label="prognozowane") # plotting predicted values
+    plt.legend(loc="upper right")
+
+    # saving plot to file and releasing figure memory
+    plt.savefig(os.path.join(directory, file_name))
+    plt.close(figure)
+
+    return file_name
+
+
+def draw_comparison(test_data: np.array, forecasts: dict, file_name: str, directory: str = config.STATIC_DIR) -> str:
+    """Plots real values and forecasted values of each model from 'forecasts' dictionary on single graph,
+    and saves created graph to 'file_name' file in 'directory'.
+    Returns saved figure file name.
+    """
+
+    # plotting real values and each model forecast on separate figure
+    figure = plt.figure()
+    plt.plot(test_data, color="black", label="rzeczywiste")
+    for name, forecast_results in forecasts.items():
+        plt.plot(forecast_results, label=name)
+    plt.legend(loc="upper right")
+
+    # saving plot to file and releasing figure memory
+    plt.savefig(os.path.join(directory, file_name))
+    plt.close(figure)
+
+    return file_name
+
+
+def _information_criteria(llf: float, parameters: int, nobs: int) -> dict:
+    """Returns AIC, BIC and HQIC information criteria of model with log-likelihood 'llf',
+    'parameters' number of estimated parameters and 'nobs' number of observations."""
+    return {
+        "aic": -2 * llf + 2 * parameters,
+        "bic": -2 * llf + parameters * np.log(nobs),
+        "hqic": -2 * llf + 2 * parameters * np.log(np.log(nobs)),
+    }
+
+
+# registered forecasting models, that can be compared
+MODELS = {
+    "ar": ar_forecast,
+    "arima": arima_forecast,
+    "ets": ets_forecast,
+}
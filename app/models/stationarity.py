@@ -0,0 +1,151 @@
+"""
+Stationarity file.
+
+This file contains methods that test stationarity of time series differenced with many orders,
+using ADF and KPSS tests, and suggest differencing order of ARIMA model.
+Results are cached per hash of time series values, so tests of the same series are not repeated.
+"""
+
+
+import hashlib
+import threading
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+from statsmodels.tsa.stattools import adfuller
+from statsmodels.tsa.stattools import kpss
+
+import config
+
+
+# minimal number of observations of differenced time series, that can be tested
+MINIMUM_OBSERVATIONS = 20
+
+# cache of tests results, with the least recently used results removed first
+_CACHE = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def suggest_differencing(
+    values: np.array,
+    max_d: int = config.STATIONARITY["MAX_D"],
+    significance: float = config.STATIONARITY["SIGNIFICANCE"]
+) -> int:
+    """Returns suggested ARIMA differencing order 'd' of time series 'values'.
+
+    Orders are tested from 0 upwards and testing stops at the first stationary order,
+    if none of orders up to 'max_d' is stationary, order 1 is returned.
+    Time series should be train subset only, so that test subset does not affect the order.
+    """
+    values = np.ascontiguousarray(values, dtype=float)
+    key = ("suggestion", _hash(values=values), max_d, significance)
+
+    def suggest() -> int:
+        differenced = values
+        for d in range(max_d + 1):
+            if _stationarity_tests(values=differenced, significance=significance)["stationary"]:
+                return d
+            differenced = np.diff(differenced)
+        return min(1, max_d)
+
+    return _cached(key=key, compute=suggest)
+
+
+def test_differencing(
+    values: np.array,
+    max_d: int = config.STATIONARITY["MAX_D"],
+    seasonal_periods: list = config.STATIONARITY["SEASONAL_PERIODS"],
+    significance: float = config.STATIONARITY["SIGNIFICANCE"]
+) -> dict:
+    """Tests stationarity of time series 'values' differenced with orders from 0 to 'max_d',
+    without and after seasonal differencing with each of 'seasonal_periods' lags.
+
+    Differenced series is stationary, if ADF test rejects unit root hypothesis
+    and KPSS test does not reject stationarity hypothesis, at 'significance' level.
+    Returns dictionary with:
+    - 'd' - the lowest stationary differencing order, or 1 if none of orders is stationary,
+    - 'seasonal' - the lowest stationary differencing order after seasonal differencing, for each seasonal lag,
+    - 'tests' - list of tests results of each differenced series.
+    This method runs all tests, so it is used only for presentation of time series analysis,
+    ARIMA differencing order is chosen by 'suggest_differencing' method.
+    Returned dictionary is shared by cache, so it shouldn't be modified.
+    """
+    values = np.ascontiguousarray(values, dtype=float)
+    key = ("tests", _hash(values=values), max_d, tuple(seasonal_periods), significance)
+
+    def test() -> dict:
+        # testing each differencing order, without and after seasonal differencing
+        tests = []
+        for period in [None] + list(seasonal_periods):
+            seasonal = values[period:] - values[:-period] if period else values
+            for d, differenced in enumerate(differences(values=seasonal, max_d=max_d)):
+                tests.append(dict(d=d, seasonal_period=period, **_stationarity_tests(values=differenced, significance=significance)))
+
+        return {
+            "d": _lowest_stationary_order(tests=tests, period=None, default=min(1, max_d)),
+            "seasonal": {period: _lowest_stationary_order(tests=tests, period=period) for period in seasonal_periods},
+            "tests": tests,
+        }
+
+    return _cached(key=key, compute=test)
+
+
+def differences(values: np.array, max_d: int) -> list:
+    """Returns list of time series 'values' differenced with orders from 0 to 'max_d'.
+    Each order is computed by single vectorized pass over previous one, without modifying 'values'."""
+    results = [values]
+    for _ in range(max_d):
+        results.append(np.diff(results[-1]))
+    return results
+
+
+def _stationarity_tests(values: np.array, significance: float) -> dict:
+    """Returns ADF and KPSS tests p-values of time series 'values' and stationarity decision.
+    ADF test uses fixed number of lags, so its cost does not grow with lag search on long series.
+    Too short or constant series are not tested and are treated as non stationary."""
+    try:
+        if len(values) < MINIMUM_OBSERVATIONS:
+            raise ValueError("Time series is too short for stationarity tests!")
+        with warnings.catch_warnings():
+            # KPSS p-values outside of tabulated range are reported as warnings
+            warnings.simplefilter("ignore")
+            adf_pvalue = adfuller(values, maxlag=config.STATIONARITY["MAX_LAG"], autolag=None)[1]
+            kpss_pvalue = kpss(values, regression="c")[1]
+    except Exception:
+        return {"adf_pvalue": None, "kpss_pvalue": None, "stationary": False}
+    else:
+        return {
+            "adf_pvalue": adf_pvalue,
+            "kpss_pvalue": kpss_pvalue,
+            "stationary": bool(adf_pvalue < significance and kpss_pvalue >= significance),
+        }
+
+
+def _lowest_stationary_order(tests: list, period: int, default: int = None) -> int:
+    """Returns the lowest differencing order, for which series with given seasonal 'period' is stationary,
+    or 'default' value if none of orders is stationary."""
+    orders = [test["d"] for test in tests if test["seasonal_period"] == period and test["stationary"]]
+    return min(orders) if orders else default
+
+
+def _hash(values: np.array) -> str:
+    """Returns hash of time series 'values'."""
+    return hashlib.sha1(values.tobytes()).hexdigest()
+
+
+def _cached(key: tuple, compute):
+    """Returns cached result of given 'key', or computes it by 'compute' method and caches it."""
+    with _CACHE_LOCK:
+        if key in _CACHE:
+            _CACHE.move_to_end(key)
+            return _CACHE[key]
+
+    result = compute()
+
+    with _CACHE_LOCK:
+        _CACHE[key] = result
+        if len(_CACHE) > config.STATIONARITY["CACHE_SIZE"]:
+            _CACHE.popitem(last=False)
+
+    return result
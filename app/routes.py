@@ -84,3 +84,39 @@ def forecast_arima():
 
     # calling ARIMA forecasting method
     return controller.forecast_arima(file_path=file_path, parameters=parameters)
+
+
+@APP.route("/ets", methods=["POST"])
+def forecast_ets():
+    """This route calls method that forecast future values of time series
+    stored in file, using Holt-Winters exponential smoothing model."""
+
+    # retrieving path to file from session
+    file_path = session["file_path"]
+
+    # retrieving parameters from form
+    parameters = {}
+    for key, value in request.form.items():
+        if value:
+            parameters[key] = value
+
+    # calling exponential smoothing forecasting method
+    return controller.forecast_ets(file_path=file_path, parameters=parameters)
+
+
+@APP.route("/compare", methods=["POST"])
+def compare_models():
+    """This route calls method that compares forecasts of time series
+    stored in file, made concurrently by all selected models."""
+
+    # retrieving path to file from session
+    file_path = session["file_path"]
+
+    # retrieving parameters from form
+    parameters = {}
+    for key, value in request.form.items():
+        if value:
+            parameters[key] = value
+
+    # calling models comparison method
+    return controller.compare_models(file_path=file_path, parameters=parameters)
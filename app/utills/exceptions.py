@@ -0,0 +1,16 @@
+"""
+Exceptions utilities script
+
+This script contains methods used for presenting handled exceptions to application users.
+"""
+
+
+import sys
+import traceback
+
+
+def exception_message() -> str:
+    """Returns type and full message of currently handled exception, as single line.
+    Multi-line messages are joined by spaces, so that they fit into single report cell or table row."""
+    message = "".join(traceback.format_exception_only(*sys.exc_info()[:2])).strip()
+    return " ".join(line.strip() for line in message.splitlines() if line.strip())
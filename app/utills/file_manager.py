@@ -9,6 +9,7 @@ import config
 import os
 import traceback
 
+import numpy as np
 import pandas as pd
 from flask import Request
 from werkzeug.utils import secure_filename
@@ -18,13 +19,58 @@ import app
 
 class FileManager:
     """Class that contains all file managements methods."""
-    
+
+    # time series columns, other columns of file are not loaded
+    COLUMNS = ["date", "value"]
+
+    # extensions of supported files
+    EXTENSIONS = (".csv", ".gz", ".bz2", ".xz", ".parquet", ".feather")
+
+    # first bytes of supported binary file formats, files without any of them are read as plain CSV
+    SIGNATURES = {
+        "gzip": (b"\x1f\x8b",),
+        "bz2": (b"BZh",),
+        "xz": (b"\xfd7zXZ\x00",),
+        "parquet": (b"PAR1",),
+        "feather": (b"ARROW1", b"FEA1"),
+    }
+
     @staticmethod
     def read_file(file_name: str) -> pd.DataFrame:
         """Reads file, which name is given by 'file_name' argument,
-        and returns content of this file as pandas DataFrame object."""
+        and returns 'date' and 'value' columns of this file as pandas DataFrame object.
+
+        File format is detected from file content. Supported formats are CSV,
+        gzip, bz2 or xz compressed CSV, which is decompressed while parsing, without writing it to disk,
+        and Parquet or Feather, from which only 'date' and 'value' columns are read.
+        """
         path = os.path.join(file_name)
-        return pd.read_csv(filepath_or_buffer=path)
+        file_format = FileManager.detect_format(file_name=path)
+
+        if file_format == "parquet":
+            dataset = pd.read_parquet(path, columns=FileManager.COLUMNS)
+        elif file_format == "feather":
+            dataset = pd.read_feather(path, columns=FileManager.COLUMNS)
+        else:
+            compression = None if file_format == "csv" else file_format
+            return pd.read_csv(filepath_or_buffer=path, usecols=FileManager.COLUMNS, compression=compression)
+
+        # unification of columnar formats data types with data types parsed from CSV file,
+        # missing dates stay missing, so that they are dropped like missing dates of CSV file
+        dataset["date"] = dataset["date"].astype(str).where(dataset["date"].notna())
+        dataset["value"] = dataset["value"].astype(np.float64)
+        return dataset
+
+    @staticmethod
+    def detect_format(file_name: str) -> str:
+        """Returns format of file, which name is given by 'file_name' argument,
+        detected by first bytes of this file."""
+        with open(file_name, "rb") as _file:
+            header = _file.read(8)
+        for file_format, signatures in FileManager.SIGNATURES.items():
+            if header.startswith(signatures):
+                return file_format
+        return "csv"
 
     @staticmethod
     def save_file(file_name: str, data: pd.DataFrame):
@@ -36,7 +82,8 @@ class FileManager:
     @staticmethod
     def upload_file(request: Request) -> str:
         """Uploads file received by request to application data directory, 
-        saves it and returns absolute path to this file."""
+        saves it and returns absolute path to this file.
+        Compressed and columnar files are saved unchanged, they are decoded only while reading."""
         try:
 
             # retrieves file from request
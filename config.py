@@ -32,3 +32,26 @@ IC_METHODS = {
     "bic": "Bayesowskie kryterium informacyjne Schwarza",
     "hqic": "Kryterium informacyjne Hannana-Quinna"
 }
+
+# forecasting models names
+MODEL_NAMES = {
+    "ar": "AR",
+    "arima": "ARIMA",
+    "ets": "Holt-Winters"
+}
+
+# default wall-clock budgets of models training in comparison, in seconds
+MODEL_TIME_BUDGETS = {
+    "ar": 10,
+    "arima": 30,
+    "ets": 10
+}
+
+# stationarity tests configuration, used for differencing order suggestion
+STATIONARITY = {
+    "MAX_D": 2,
+    "SEASONAL_PERIODS": [7, 12],
+    "SIGNIFICANCE": 0.05,
+    "MAX_LAG": 12,
+    "CACHE_SIZE": 128
+}
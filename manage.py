@@ -6,11 +6,48 @@ Main module file, used for managing and starting application server.
 from flask_script import Manager
 
 from app import APP
+from app import batch as batch_processing
 
 
 # application command manager
 manager = Manager(APP)
 
+
+@manager.option("-s", "--source", dest="source", required=True, help="directory or glob pattern of time series files")
+@manager.option("-o", "--output", dest="report", default="report.csv", help="report file, '.jsonl' extension for JSON lines, CSV otherwise")
+@manager.option("-m", "--models", dest="models", default="ar,arima", help="comma separated forecasting models: ar, arima, ets (default = ar,arima)")
+@manager.option("-w", "--workers", dest="workers", type=int, default=None, help="number of worker processes (default = number of CPU cores)")
+@manager.option("-p", "--plots", dest="plots_dir", default=None, help="directory for forecast plots, plots are not drawn if omitted")
+@manager.option("-r", "--resume", dest="resume", action="store_true", help="skip files successfully processed in existing report, retry failed ones")
+@manager.option("--split-ratio", dest="split_ratio", type=float, default=0.8, help="train and test datasets split ratio (default = 0.8)")
+@manager.option("--ic", dest="ic", default="aic", choices=["aic", "bic", "hqic"], help="AR optimal lag length selection criterion (default = aic)")
+@manager.option("--order", dest="order", default="10,,2", help="comma separated ARIMA p,d,q parameters, empty d is suggested by stationarity tests (default = 10,,2)")
+@manager.option("--ets-trend", dest="ets_trend", action="store_true", help="exponential smoothing model with trend component")
+@manager.option("--seasonal-period", dest="seasonal_period", type=int, default=0, help="exponential smoothing seasonal period (default = 0, no seasonality)")
+def batch(source, report, models, workers, plots_dir, resume, split_ratio, ic, order, ets_trend, seasonal_period):
+    """Analyses and forecasts all time series files from directory or glob pattern, without browser session."""
+    if report.endswith(".json"):
+        raise SystemExit("report is written as JSON lines, use '.jsonl' extension")
+
+    models = [model.strip() for model in models.split(",") if model.strip()]
+    unknown_models = set(models) - set(batch_processing.MODEL_COLUMNS)
+    if unknown_models:
+        raise SystemExit(f"unknown models: {', '.join(sorted(unknown_models))}")
+
+    settings = {
+        "models": models,
+        "split_ratio": split_ratio,
+        "parameters": {
+            "ar": {"ic": ic},
+            "arima": {"order": tuple(int(parameter) if parameter.strip() else None for parameter in order.split(","))},
+            "ets": {"trend": ets_trend, "seasonal_period": seasonal_period},
+        },
+        "plots_dir": plots_dir,
+    }
+    processed = batch_processing.run(source=source, report_path=report, settings=settings, workers=workers, resume=resume)
+    print(f"{processed} time series processed, report saved to '{report}'.")
+
+
 # main server loop
 if __name__ == "__main__":
     manager.run()
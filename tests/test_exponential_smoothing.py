@@ -0,0 +1,79 @@
+"""
+Exponential smoothing model tests.
+
+These tests check that one-step errors and final state computed by linear filter
+are equal to errors and state computed by plain smoothing recursions.
+"""
+
+
+import unittest
+
+import numpy as np
+
+from app.models.exponential_smoothing import ExponentialSmoothing
+
+
+class ExponentialSmoothingTest(unittest.TestCase):
+    """Tests of ExponentialSmoothing class."""
+
+    # model configurations, trend and seasonal period
+    CONFIGURATIONS = [(False, None), (True, None), (False, 12), (True, 12), (True, 7)]
+
+    # smoothing parameters, alpha, beta and gamma
+    PARAMETERS = [(0.3, 0.05, 0.1), (0.9, 0.5, 0.05), (0.05, 0.01, 0.5)]
+
+    def setUp(self):
+        """Creates seasonal time series with trend and noise."""
+        time = np.arange(500)
+        noise = np.random.RandomState(0).normal(size=len(time))
+        self.data = 100 + 0.05 * time + 10 * np.sin(2 * np.pi * time / 12) + noise
+
+    def test_filter_errors_equal_recursive_errors(self):
+        """Errors computed by linear filter are equal to errors of smoothing recursions."""
+        for trend, seasonal_period in self.CONFIGURATIONS:
+            model = ExponentialSmoothing(self.data, trend=trend, seasonal_period=seasonal_period)
+            for alpha, beta, gamma in self._parameters(trend=trend, seasonal_period=seasonal_period):
+                with self.subTest(trend=trend, seasonal_period=seasonal_period, alpha=alpha, beta=beta, gamma=gamma):
+                    np.testing.assert_allclose(
+                        model._errors(alpha=alpha, beta=beta, gamma=gamma),
+                        model._recursive_errors(alpha=alpha, beta=beta, gamma=gamma, steps=model.nobs),
+                        atol=1e-8
+                    )
+
+    def test_final_state_equals_recursive_state(self):
+        """Final state computed from weighted errors is equal to state after smoothing recursions."""
+        for trend, seasonal_period in self.CONFIGURATIONS:
+            model = ExponentialSmoothing(self.data, trend=trend, seasonal_period=seasonal_period)
+            for alpha, beta, gamma in self._parameters(trend=trend, seasonal_period=seasonal_period):
+                with self.subTest(trend=trend, seasonal_period=seasonal_period, alpha=alpha, beta=beta, gamma=gamma):
+                    model.errors = model._recursive_errors(alpha=alpha, beta=beta, gamma=gamma, steps=model.nobs)
+                    level, slope, season = model._final_state(alpha=alpha, beta=beta, gamma=gamma)
+
+                    # smoothing recursions started from initial state
+                    expected_level, expected_slope, expected_season = model.initial_state
+                    expected_season = expected_season.copy()
+                    for t, error in enumerate(model.errors):
+                        phase = (t + 1) % len(expected_season)
+                        expected_level += expected_slope + alpha * error
+                        expected_slope += beta * error
+                        expected_season[phase] += gamma * error
+
+                    self.assertAlmostEqual(level, expected_level, places=6)
+                    self.assertAlmostEqual(slope, expected_slope, places=6)
+                    np.testing.assert_allclose(season, expected_season, atol=1e-8)
+
+    def test_linear_data_has_no_errors(self):
+        """Holt's method forecasts exactly time series, that is linear function of time."""
+        model = ExponentialSmoothing(10 + 2 * np.arange(50.0), trend=True)
+        np.testing.assert_allclose(model._errors(alpha=0.5, beta=0.05, gamma=0.0), 0.0, atol=1e-10)
+
+    def _parameters(self, trend: bool, seasonal_period: int) -> list:
+        """Returns smoothing parameters with beta and gamma set to zero for models without trend or seasonality."""
+        return [
+            (alpha, beta if trend else 0.0, gamma if seasonal_period else 0.0)
+            for alpha, beta, gamma in self.PARAMETERS
+        ]
+
+
+if __name__ == "__main__":
+    unittest.main()